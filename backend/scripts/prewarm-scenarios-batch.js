@@ -0,0 +1,115 @@
+/**
+ * Fill the scenario bank (data/scenario-bank.json) via the OpenAI Batch API:
+ * half the token cost of live generation, at the price of up to 24h turnaround.
+ * The live endpoint serves banked scenarios to "cached" requests before generating.
+ *
+ * Run from backend:
+ *   node scripts/prewarm-scenarios-batch.js submit [perDifficulty=10]
+ *     → uploads one request per scenario and prints the batch id
+ *   node scripts/prewarm-scenarios-batch.js collect <batch_id>
+ *     → if the batch has completed, appends its scenarios to the bank (once per batch)
+ * Requires OPENAI_API_KEY in env or .env.
+ */
+import 'dotenv/config';
+import OpenAI, { toFile } from 'openai';
+import { buildScenarioRequest, parseScenarioContent } from '../src/services/scenarioGenerator.js';
+import { appendToScenarioBank, getScenarioBankPath, hasCollectedBatch } from '../src/services/scenarioBank.js';
+
+const DIFFICULTIES = ['easy', 'medium', 'hard'];
+const CHAT_COMPLETIONS_ENDPOINT = '/v1/chat/completions';
+
+async function submit(client, perDifficulty) {
+  const lines = [];
+  for (const difficulty of DIFFICULTIES) {
+    for (let i = 0; i < perDifficulty; i++) {
+      const { scenarioType, body } = buildScenarioRequest(difficulty);
+      lines.push(JSON.stringify({
+        // difficulty:scenarioType:index — read back in collect() to label the result.
+        custom_id: `${difficulty}:${scenarioType}:${i}`,
+        method: 'POST',
+        url: CHAT_COMPLETIONS_ENDPOINT,
+        body,
+      }));
+    }
+  }
+
+  const file = await client.files.create({
+    file: await toFile(Buffer.from(lines.join('\n'), 'utf8'), 'scenario-prewarm.jsonl'),
+    purpose: 'batch',
+  });
+  const batch = await client.batches.create({
+    input_file_id: file.id,
+    endpoint: CHAT_COMPLETIONS_ENDPOINT,
+    completion_window: '24h',
+  });
+  console.log(`Submitted batch ${batch.id} (${lines.length} scenarios, status: ${batch.status})`);
+  console.log(`Collect with: node scripts/prewarm-scenarios-batch.js collect ${batch.id}`);
+}
+
+async function collect(client, batchId) {
+  if (await hasCollectedBatch(batchId)) {
+    console.log(`Batch ${batchId} was already collected into ${getScenarioBankPath()}.`);
+    return;
+  }
+  const batch = await client.batches.retrieve(batchId);
+  if (batch.status !== 'completed') {
+    console.log(`Batch ${batchId} is ${batch.status}; try again later.`);
+    return;
+  }
+  if (!batch.output_file_id) {
+    console.log(`Batch ${batchId} completed without output (see error file ${batch.error_file_id}).`);
+    return;
+  }
+
+  const output = await (await client.files.content(batch.output_file_id)).text();
+  const payloads = [];
+  let failed = 0;
+  for (const line of output.split('\n')) {
+    if (!line.trim()) continue;
+    const result = JSON.parse(line);
+    const content = result.response?.status_code === 200
+      ? result.response.body?.choices?.[0]?.message?.content
+      : null;
+    try {
+      if (!content) throw new Error(result.error?.message || 'empty response');
+      const [difficulty, scenarioType] = String(result.custom_id).split(':');
+      payloads.push(parseScenarioContent(content, { difficulty, scenarioType }));
+    } catch (err) {
+      failed++;
+      console.error(`${result.custom_id}: ${err.message}`);
+    }
+  }
+
+  const { added, sizes } = await appendToScenarioBank(payloads, batchId);
+  if (!added) {
+    console.log(`Batch ${batchId} was already collected into ${getScenarioBankPath()}.`);
+    return;
+  }
+  console.log(`Added ${payloads.length} scenarios (${failed} failed) to ${getScenarioBankPath()}`);
+  console.log(`Bank now has easy=${sizes.easy}, medium=${sizes.medium}, hard=${sizes.hard}`);
+}
+
+async function main() {
+  const [command, arg] = process.argv.slice(2);
+  const apiKey = process.env.OPENAI_API_KEY;
+  if (!apiKey) throw new Error('OPENAI_API_KEY environment variable is not set');
+  const client = new OpenAI({ apiKey });
+
+  if (command === 'submit') {
+    const perDifficulty = arg != null ? parseInt(arg, 10) : 10;
+    if (!Number.isInteger(perDifficulty) || perDifficulty < 1) {
+      throw new Error('perDifficulty must be a positive integer');
+    }
+    await submit(client, perDifficulty);
+  } else if (command === 'collect' && arg) {
+    await collect(client, arg);
+  } else {
+    console.log('Usage: node scripts/prewarm-scenarios-batch.js submit [perDifficulty] | collect <batch_id>');
+    process.exit(1);
+  }
+}
+
+main().catch((err) => {
+  console.error(err);
+  process.exit(1);
+});
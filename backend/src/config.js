@@ -2,6 +2,12 @@ import dotenv from 'dotenv';
 
 dotenv.config();
 
+/** Parse a non-negative integer env value, falling back to `fallback` when unset or invalid. */
+function parseNonNegativeInt(value, fallback) {
+  const n = parseInt(value ?? '', 10);
+  return Number.isFinite(n) && n >= 0 ? n : fallback;
+}
+
 /**
  * Configuration for the 911 call simulation backend.
  *
@@ -39,6 +45,18 @@ export const config = {
   /** Directory (relative to project root) where generated audio files are saved. */
   generatedAudioDir: process.env.GENERATED_AUDIO_DIR || 'generated-audio',
 
+  /** Pre-generated scenarios kept per difficulty for requests sent with `cached: true` (0 disables). */
+  scenarioCache: {
+    size: parseNonNegativeInt(process.env.SCENARIO_CACHE_SIZE, 3),
+    /** Fill the buffers at server start (paid OpenAI calls). Opt-in; never under node --watch. */
+    prewarmOnStart: process.env.SCENARIO_CACHE_PREWARM === 'true',
+  },
+
+  /** Scenario bank filled offline by scripts/prewarm-scenarios-batch.js. Relative to backend root. */
+  scenarioBank: {
+    path: process.env.SCENARIO_BANK_PATH || 'data/scenario-bank.json',
+  },
+
   /** RAG: directory containing 911 operator reference docs (.md, .txt). Relative to backend root. */
   rag: {
     docsDir: process.env.RAG_DOCS_DIR || 'ragDocs',
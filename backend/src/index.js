@@ -8,6 +8,7 @@ import callAudioRouter from './routes/callAudio.js';
 import scenariosRouter from './routes/scenarios.js';
 import vehiclesRouter from './routes/vehicles.js';
 import { startSimulation } from './services/vehicleSimulation.js';
+import { prewarmScenarioCache } from './services/scenarioCache.js';
 import callEvaluationRouter from './routes/callEvaluation.js';
 import crimesRouter from './routes/crimes.js';
 import roadsRouter from './routes/roads.js';
@@ -55,6 +56,10 @@ const server = http.createServer(app);
 
 server.listen(config.port, () => {
   startSimulation();
+  // Opt-in: fill the per-difficulty scenario buffers so the first cached request is a hit.
+  if (config.scenarioCache.prewarmOnStart) {
+    prewarmScenarioCache();
+  }
   console.log(`911 call simulation backend running at http://localhost:${config.port}`);
   console.log('POST /api/scenarios/generate with body: { "difficulty": "easy"|"medium"|"hard" }');
   console.log('POST /generate-call-audio with body: { "scenario": "..." }');
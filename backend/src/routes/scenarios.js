@@ -1,12 +1,23 @@
 import { Router } from 'express';
-import { generateScenario } from '../services/scenarioGenerator.js';
+import { getScenario } from '../services/scenarioCache.js';
+import { generateScenarios, MAX_SCENARIO_BATCH } from '../services/scenarioGenerator.js';
 
 const router = Router();
 
+/** Error messages from generateScenario(s) that describe a bad request rather than a failed generation. */
+const CLIENT_ERROR_PREFIXES = [
+  'OPENAI_API_KEY environment variable is not set',
+  'difficulty must be one of',
+  'count must be an integer',
+];
+
 /**
  * POST /api/scenarios/generate
  *
- * Body: { "difficulty": "easy" | "medium" | "hard" }
+ * Body: { "difficulty": "easy" | "medium" | "hard", "cached"?: boolean, "count"?: number }
+ * With "cached": true (or ?cached=1), a pre-generated scenario is returned when one is ready.
+ * With "count" (1–8), that many scenarios are generated in one LLM call and returned as
+ * { "scenarios": [payload, ...] }.
  * Returns: Full scenario payload (scenario, persona, caller_script, role_instruction,
  * scenario_summary_for_agent, critical_info, behavior_notes, etc.) for frontend and
  * ElevenLabs Flash v2.5 voice agent.
@@ -24,11 +35,23 @@ router.post('/generate', async (req, res) => {
     return res.status(400).json({ error: 'difficulty must be one of: easy, medium, hard' });
   }
 
+  const count = req.body?.count;
+  if (count != null && (!Number.isInteger(count) || count < 1 || count > MAX_SCENARIO_BATCH)) {
+    return res.status(400).json({ error: `count must be an integer from 1 to ${MAX_SCENARIO_BATCH}` });
+  }
+
   try {
-    const payload = await generateScenario(normalized);
+    if (count != null) {
+      const scenarios = await generateScenarios(normalized, count);
+      return res.json({ scenarios });
+    }
+    const cached = req.body?.cached === true || req.query?.cached === '1';
+    const payload = await getScenario(normalized, { cached });
     return res.json(payload);
   } catch (err) {
-    if (err.message?.includes('OPENAI_API_KEY') || err.message?.includes('difficulty')) {
+    // Only input/config errors are the client's; upstream output errors (which may
+    // mention field names such as "difficulty") stay 500s.
+    if (CLIENT_ERROR_PREFIXES.some((prefix) => err.message?.startsWith(prefix))) {
       return res.status(400).json({ error: err.message });
     }
     console.error('Scenario generation failed:', err.message);
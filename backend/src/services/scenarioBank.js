@@ -0,0 +1,138 @@
+/**
+ * Persistent bank of pre-generated scenarios (JSON file), filled offline through the
+ * OpenAI Batch API by scripts/prewarm-scenarios-batch.js and read by the live endpoint
+ * before falling back to synchronous generation.
+ *
+ * File shape: { "easy": [payload, ...], "medium": [...], "hard": [...], "collected_batches": [batchId, ...] }.
+ * The bank is a queue: taking scenarios removes them from the file (rewritten atomically),
+ * so restarts and other processes do not serve them again. collected_batches makes
+ * collecting the same batch twice a no-op.
+ */
+
+import fs from 'fs/promises';
+import path from 'path';
+import { fileURLToPath } from 'url';
+import { config } from '../config.js';
+
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+const BACKEND_ROOT = path.join(__dirname, '..', '..');
+
+const DIFFICULTIES = ['easy', 'medium', 'hard'];
+
+/** Tail of the in-process queue of bank updates; each read-modify-write waits for the last. */
+let pendingUpdate = Promise.resolve();
+/** Whether the current unreadable-bank error was already logged (reset after a good read). */
+let unreadableLogged = false;
+
+/** Absolute path of the scenario bank file. */
+export function getScenarioBankPath() {
+  return path.resolve(BACKEND_ROOT, config.scenarioBank?.path || 'data/scenario-bank.json');
+}
+
+/**
+ * Read the bank file; a missing file yields an empty bank.
+ * @returns {Promise<{ easy: object[], medium: object[], hard: object[], collected_batches: string[] }>}
+ * @throws {Error} If the file exists but cannot be read or parsed (so callers never overwrite it).
+ */
+async function loadBank() {
+  const bank = { easy: [], medium: [], hard: [], collected_batches: [] };
+  const bankPath = getScenarioBankPath();
+  let data;
+  try {
+    data = JSON.parse(await fs.readFile(bankPath, 'utf8'));
+  } catch (err) {
+    if (err.code === 'ENOENT') return bank;
+    throw new Error(`Scenario bank ${bankPath} is unreadable: ${err.message}`);
+  }
+  for (const key of [...DIFFICULTIES, 'collected_batches']) {
+    if (Array.isArray(data?.[key])) bank[key] = data[key];
+  }
+  return bank;
+}
+
+/** Write the bank via a temp file + rename, so readers never see a partial file. */
+async function saveBank(bank) {
+  const bankPath = getScenarioBankPath();
+  await fs.mkdir(path.dirname(bankPath), { recursive: true });
+  const tmpPath = `${bankPath}.${process.pid}.tmp`;
+  await fs.writeFile(tmpPath, JSON.stringify(bank), 'utf8');
+  await fs.rename(tmpPath, bankPath);
+}
+
+/**
+ * Run one read-modify-write of the bank after any in-process update still pending.
+ * `update(bank)` returns { result, changed }; the bank is saved only when changed.
+ */
+function updateBank(update) {
+  const run = pendingUpdate.then(async () => {
+    const bank = await loadBank();
+    const { result, changed } = update(bank);
+    if (changed) await saveBank(bank);
+    return result;
+  });
+  pendingUpdate = run.catch(() => {});
+  return run;
+}
+
+function bankSizes(bank) {
+  return { easy: bank.easy.length, medium: bank.medium.length, hard: bank.hard.length };
+}
+
+/**
+ * Whether the results of `batchId` have already been added to the bank.
+ * @param {string} batchId - OpenAI batch id.
+ * @returns {Promise<boolean>}
+ * @throws {Error} If the bank file is unreadable.
+ */
+export async function hasCollectedBatch(batchId) {
+  return (await loadBank()).collected_batches.includes(batchId);
+}
+
+/**
+ * Append a batch's payloads to the bank file (grouped by payload.scenario.difficulty)
+ * and record the batch as collected. A batch that was already collected is skipped.
+ * @param {object[]} payloads - Results of parseScenarioContent().
+ * @param {string} batchId - OpenAI batch id the payloads came from.
+ * @returns {Promise<{ added: boolean, sizes: { easy: number, medium: number, hard: number } }>}
+ * @throws {Error} If the bank file exists but is unreadable (it is left untouched).
+ */
+export function appendToScenarioBank(payloads, batchId) {
+  return updateBank((bank) => {
+    if (bank.collected_batches.includes(batchId)) {
+      return { result: { added: false, sizes: bankSizes(bank) }, changed: false };
+    }
+    for (const payload of payloads) {
+      const difficulty = payload?.scenario?.difficulty;
+      if (bank[difficulty]) bank[difficulty].push(payload);
+    }
+    bank.collected_batches.push(batchId);
+    return { result: { added: true, sizes: bankSizes(bank) }, changed: true };
+  });
+}
+
+/**
+ * Take (and remove from the file) up to `n` banked scenarios for `difficulty`, in one
+ * read-modify-write. Takes within this process are serialized; other processes can
+ * still race on the same read.
+ * @param {string} difficulty - One of "easy", "medium", "hard".
+ * @param {number} n - Maximum number of scenarios to take.
+ * @returns {Promise<object[]>} Empty when none are left or the bank is unreadable
+ *   (logged once until the file reads cleanly again).
+ */
+export async function takeBankedScenarios(difficulty, n) {
+  if (!DIFFICULTIES.includes(difficulty) || !(n > 0)) return [];
+  try {
+    const taken = await updateBank((bank) => {
+      const payloads = bank[difficulty].splice(0, n);
+      return { result: payloads, changed: payloads.length > 0 };
+    });
+    unreadableLogged = false;
+    return taken;
+  } catch (err) {
+    if (!unreadableLogged) {
+      unreadableLogged = true;
+      console.error(err.message);
+    }
+    return [];
+  }
+}
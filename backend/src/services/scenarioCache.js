@@ -0,0 +1,85 @@
+/**
+ * In-process buffer of pre-generated scenarios, keyed by difficulty.
+ *
+ * Scenario generation is one LLM round-trip (seconds, and billed per call). Keeping a
+ * few ready payloads per difficulty lets opted-in requests be served immediately;
+ * the buffer is refilled in the background after each take, first from the offline
+ * scenario bank (see scenarioBank.js) and only then by generating new scenarios.
+ */
+
+import { config } from '../config.js';
+import { generateScenario, generateScenarios, MAX_SCENARIO_BATCH } from './scenarioGenerator.js';
+import { takeBankedScenarios } from './scenarioBank.js';
+
+const DIFFICULTIES = ['easy', 'medium', 'hard'];
+
+/** Ready payloads per difficulty (FIFO; each payload is handed out once). */
+const buffers = { easy: [], medium: [], hard: [] };
+/** Payloads currently being fetched per difficulty, so refills don't overshoot the buffer size. */
+const inFlight = { easy: 0, medium: 0, hard: 0 };
+
+function bufferSize() {
+  const size = config.scenarioCache?.size;
+  return Number.isFinite(size) ? Math.max(0, size) : 0;
+}
+
+/**
+ * Fetch `missing` payloads into the buffer: as many as the scenario bank has (one file
+ * read-modify-write), then the rest in one batched LLM call (at most MAX_SCENARIO_BATCH).
+ */
+async function fillBuffer(difficulty, missing) {
+  const banked = await takeBankedScenarios(difficulty, missing);
+  buffers[difficulty].push(...banked);
+
+  const remaining = Math.min(MAX_SCENARIO_BATCH, missing - banked.length);
+  if (remaining <= 0) return;
+  const payloads = await generateScenarios(difficulty, remaining);
+  for (const payload of payloads) {
+    if (buffers[difficulty].length < bufferSize()) buffers[difficulty].push(payload);
+  }
+}
+
+/**
+ * Top up the buffer for `difficulty` to the configured size (minus in-flight fetches) in
+ * the background, from the scenario bank first and then by generating. Failures are
+ * logged and dropped.
+ * @param {string} difficulty - One of "easy", "medium", "hard".
+ */
+export function refillScenarioCache(difficulty) {
+  if (!buffers[difficulty] || process.env.DEMO === 'true') return;
+  const missing = bufferSize() - buffers[difficulty].length - inFlight[difficulty];
+  if (missing <= 0) return;
+
+  inFlight[difficulty] += missing;
+  fillBuffer(difficulty, missing)
+    .catch((err) => {
+      console.error(`Scenario cache refill (${difficulty}) failed:`, err.message);
+    })
+    .finally(() => {
+      inFlight[difficulty] -= missing;
+    });
+}
+
+/** Refill the buffers for every difficulty. */
+export function prewarmScenarioCache() {
+  for (const difficulty of DIFFICULTIES) refillScenarioCache(difficulty);
+}
+
+/**
+ * Get a scenario payload, preferring a pre-generated one (buffer, then scenario bank)
+ * when `cached` is true. Falls back to a synchronous generateScenario() on a miss.
+ * Either way the buffer for that difficulty is topped up.
+ *
+ * @param {string} difficulty - One of "easy", "medium", "hard" (already normalized).
+ * @param {{ cached?: boolean }} [options]
+ * @returns {Promise<object>} Same payload shape as generateScenario().
+ */
+export async function getScenario(difficulty, { cached = false } = {}) {
+  // DEMO serves DEMO_SCENARIO_PAYLOAD only, never buffered or banked LLM scenarios.
+  if (!cached || process.env.DEMO === 'true') return generateScenario(difficulty);
+
+  let payload = buffers[difficulty]?.shift();
+  if (!payload) [payload] = await takeBankedScenarios(difficulty, 1);
+  refillScenarioCache(difficulty);
+  return payload ?? generateScenario(difficulty);
+}
@@ -8,9 +8,9 @@
  * Use buildVoiceAgentSystemPrompt(payload) to produce the full system prompt string.
  */
 
-import OpenAI from 'openai';
-import { randomUUID } from 'crypto';
+import { randomBytes } from 'crypto';
 import { config } from '../config.js';
+import { compileSchema } from '../utils/jsonSchema.js';
 
 // -----------------------------------------------------------------------------
 // Scenario type pools (per difficulty) for diversity
@@ -73,51 +73,205 @@ function pickRandomScenarioType(difficulty) {
   return pool[Math.floor(Math.random() * pool.length)];
 }
 
+/**
+ * Pick `count` scenario types for one batched request, without repeats while the
+ * pool lasts (Fisher–Yates shuffle of the pool, cycled if count exceeds it).
+ * @param {string} difficulty - One of "easy", "medium", "hard".
+ * @param {number} count - Number of scenario types to pick.
+ * @returns {string[]} scenario_type slugs.
+ */
+function pickRandomScenarioTypes(difficulty, count) {
+  const pool = [...(SCENARIO_TYPES_BY_DIFFICULTY[difficulty] || ['traffic-accident'])];
+  for (let i = pool.length - 1; i > 0; i--) {
+    const j = Math.floor(Math.random() * (i + 1));
+    [pool[i], pool[j]] = [pool[j], pool[i]];
+  }
+  return Array.from({ length: count }, (_, i) => pool[i % pool.length]);
+}
+
 // -----------------------------------------------------------------------------
 // Prompts (optimized: only scenario + timeline; voice/persona derived from these)
 // -----------------------------------------------------------------------------
 
-const SYSTEM_PROMPT = `You are an AI 911 training assistant. Generate exactly ONE realistic emergency scenario. Output valid JSON only, no markdown.
+const SYSTEM_PROMPT = `You are an AI 911 training assistant. Generate realistic emergency scenarios (exactly ONE unless the user message asks for several). The response format is enforced by a JSON schema; these rules cover content only.
 
 Rules:
 - Realistic, grounded emergencies. No language-barrier scenarios (caller always speaks English). Use the scenario_type from the user message.
 - Scenario is in San Francisco. Include in scenario a location: address (human-readable, e.g. "2500 Mission St, San Francisco"), lat and lng as numbers with at least 5 decimal places (lat 37.7–37.83, lng -122.52 to -122.35) so the incident can be shown precisely on the SF map. Choose a location that is realistic for the scenario type and difficulty, and choose a variety of locations, especially ones in downtown.
-- scenario: id, scenario_type, title, description (2-4 sentences; for hard: describe an evolving situation—initial crisis plus how it can escalate or cascade), caller_profile, critical_info (4-7 facts; for hard include details that become relevant as situation evolves), expected_actions (4-7), optional_complications (1-3; for hard include escalation/cascade possibilities), difficulty, language "en", location: { address: "", lat: 37.77492, lng: -122.41941 } (use 5+ decimals for lat/lng).
-- persona: stability 0-1 (lower=more emotional), style 0-1, speed ~1.0, voice_description (accent, age, gender, tone). Match difficulty: easy=calm/clear (0.7+ stability); medium=anxious (0.4-0.55); hard=panicked (0.15-0.35).
-- Voice-agent fields (match difficulty): role_instruction (one line "You are [name], [age], calling 911..."), scenario_summary_for_agent (2-4 sentences; for hard, include that the situation may escalate or change and the caller will report new developments as they happen), withheld_information (0-4 items), behavior_notes, dialogue_directions (how to speak: easy=clear; hard=fragmented, crying), response_behavior (when to give address/info), opening_line, do_not_say (stay in character).
-- timeline: Include only things that happen in the scene that the operator can act on (e.g. person stops breathing, smoke appears, victim becomes unresponsive, second person found, roof caves in, shooter enters the room, weapon produced, fire spreads to adjacent building, suspect moves). Do NOT include caller behavior or emotion—forbidden: "caller becomes quieter", "caller starts crying", "caller gets more panicked", "caller goes silent", "tension rises", "caller gets more upset". Only concrete events and actionable information. Easy/medium: 0–3 events. Hard: 3–5+ events that are major scene changes (escalations, cascading danger, new threat), not filler. Empty {} when the situation has no developing scene.
+- scenario: id "" (assigned by the server), description (2-4 sentences; for hard: describe an evolving situation—initial crisis plus how it can escalate or cascade), caller_profile (other_relevant_details may be ""), critical_info (4-7 facts; for hard include details that become relevant as situation evolves), expected_actions (4-7), optional_complications (1-3; for hard include escalation/cascade possibilities), language "en".
+- Voice-agent fields (match difficulty): withheld_information (0-4 details that only come out when the operator probes), response_behavior (when to give address/info), opening_line, do_not_say (stay in character).
+- timeline: Include only things that happen in the scene that the operator can act on (e.g. person stops breathing, smoke appears, victim becomes unresponsive, second person found, roof caves in, shooter enters the room, weapon produced, fire spreads to adjacent building, suspect moves). Do NOT include caller behavior or emotion—forbidden: "caller becomes quieter", "caller starts crying", "caller gets more panicked", "caller goes silent", "tension rises", "caller gets more upset". Only concrete events and actionable information, each with the seconds into the call when it happens; give every event a distinct seconds value. Easy/medium: 0–3 events. Hard: 3–5+ events that are major scene changes (escalations, cascading danger, new threat), not filler. Empty when the situation has no developing scene.
 
 Difficulty: Easy=calm, volunteers info. Medium=stressed, needs prompting. Hard=panicked, does not volunteer address or key facts; multi-phase with escalations.
 
-Output JSON (these keys only):
-{
-  "scenario": { "id": "", "scenario_type": "", "title": "", "description": "", "caller_profile": { "name": "", "age": 0, "emotion": "", "gender": "", "race": "", "other_relevant_details": "" }, "critical_info": [], "expected_actions": [], "optional_complications": [], "difficulty": "easy|medium|hard", "language": "en", "location": { "address": "e.g. 2500 Mission St, San Francisco", "lat": 37.77492, "lng": -122.41941 } },
-  "persona": { "stability": 0.5, "style": 0.5, "speed": 1.0, "voice_description": "" },
-  "role_instruction": "",
-  "scenario_summary_for_agent": "",
-  "withheld_information": [],
-  "behavior_notes": "",
-  "dialogue_directions": "",
-  "response_behavior": [],
-  "opening_line": "",
-  "do_not_say": [],
-  "timeline": { "10": "<event>", "25": "<event>" }
-}`;
+Hard scenarios: make them complex and dynamic: the situation should evolve during the call—sudden escalations (shooter enters the room, weapon pulled), cascading events (crash triggers fire that spreads), new information (e.g. second victim found), unexpected developments. Include 3–5 timeline events: only concrete scene changes the operator can act on (e.g. shooter enters room, weapon produced, fire spreads to building, second victim found). No filler (no "caller gets more upset", "tension rises", or caller emotion).`;
+
+// Everything that is the same for every request lives in SYSTEM_PROMPT (and the
+// response schema), so OpenAI's automatic prompt caching can reuse that prefix;
+// per-request details go only in the short user message at the end.
 
 function userPrompt(difficulty, scenarioType) {
-  const base = `Generate one 911 training scenario for difficulty: ${difficulty}. Scenario type for this request must be: ${scenarioType}. Use that scenario_type in the JSON and build the scenario around it. Return only the JSON object, no other text. Ensure the scenario is realistic, grounded, and appropriate for 911 operator training.`;
-  if (difficulty === 'hard') {
-    return `${base} Make it complex and dynamic: the situation should evolve during the call—sudden escalations (shooter enters the room, weapon pulled), cascading events (crash triggers fire that spreads), new information (e.g. second victim found), unexpected developments. Include 3–5 timeline events: only concrete scene changes the operator can act on (e.g. shooter enters room, weapon produced, fire spreads to building, second victim found). No filler (no "caller gets more upset", "tension rises", or caller emotion).`;
-  }
-  return base;
+  return `Generate one 911 training scenario for difficulty: ${difficulty}. Scenario type for this request must be: ${scenarioType}. Use that scenario_type in the JSON and build the scenario around it. Ensure the scenario is realistic, grounded, and appropriate for 911 operator training.`;
 }
 
+function batchUserPrompt(difficulty, scenarioTypes) {
+  return `Generate ${scenarioTypes.length} distinct 911 training scenarios for difficulty: ${difficulty}, one per scenario type, in this order: ${scenarioTypes.join(', ')}. Return them in the "scenarios" array; each item follows the rules above and uses its scenario_type. Use a different caller and location for each. Ensure every scenario is realistic, grounded, and appropriate for 911 operator training.`;
+}
+
+/**
+ * Prebuilt chat messages per difficulty and scenario type (the only inputs to the
+ * prompt), so each request just indexes instead of re-formatting the user prompt.
+ */
+const MESSAGES_BY_DIFFICULTY = Object.fromEntries(
+  Object.entries(SCENARIO_TYPES_BY_DIFFICULTY).map(([difficulty, types]) => [
+    difficulty,
+    Object.fromEntries(
+      types.map((scenarioType) => [
+        scenarioType,
+        Object.freeze([
+          Object.freeze({ role: 'system', content: SYSTEM_PROMPT }),
+          Object.freeze({ role: 'user', content: userPrompt(difficulty, scenarioType) }),
+        ]),
+      ])
+    ),
+  ])
+);
+
+function getMessages(difficulty, scenarioType) {
+  return MESSAGES_BY_DIFFICULTY[difficulty]?.[scenarioType] ?? [
+    { role: 'system', content: SYSTEM_PROMPT },
+    { role: 'user', content: userPrompt(difficulty, scenarioType) },
+  ];
+}
+
+// -----------------------------------------------------------------------------
+// Response schema (LLM output only; voice-agent fields are derived in-code)
+// -----------------------------------------------------------------------------
+
+// Sent to OpenAI as a strict structured-outputs schema, so every object is closed
+// and lists all of its keys as required. Strict mode has no free-form maps, so the
+// timeline comes back as [{ seconds, event }] and is converted to the map shape.
+
+const stringArray = { type: 'array', items: { type: 'string' } };
+
+function strictObject(properties) {
+  return {
+    type: 'object',
+    properties,
+    required: Object.keys(properties),
+    additionalProperties: false,
+  };
+}
+
+export const SCENARIO_RESPONSE_SCHEMA = strictObject({
+  scenario: strictObject({
+    id: { type: 'string' },
+    scenario_type: { type: 'string' },
+    title: { type: 'string' },
+    description: { type: 'string' },
+    caller_profile: strictObject({
+      name: { type: 'string' },
+      age: { type: 'number' },
+      emotion: { type: 'string' },
+      gender: { type: 'string' },
+      race: { type: 'string' },
+      other_relevant_details: { type: 'string' },
+    }),
+    critical_info: stringArray,
+    expected_actions: stringArray,
+    optional_complications: stringArray,
+    difficulty: { type: 'string', enum: ['easy', 'medium', 'hard'] },
+    language: { type: 'string', enum: ['en'] },
+    location: strictObject({
+      address: { type: 'string' },
+      lat: { type: 'number' },
+      lng: { type: 'number' },
+    }),
+  }),
+  withheld_information: stringArray,
+  response_behavior: stringArray,
+  opening_line: { type: 'string' },
+  do_not_say: stringArray,
+  timeline: {
+    type: 'array',
+    items: strictObject({
+      seconds: { type: 'integer' },
+      event: { type: 'string' },
+    }),
+  },
+});
+
+const SCENARIO_RESPONSE_FORMAT = {
+  type: 'json_schema',
+  json_schema: { name: 'scenario', schema: SCENARIO_RESPONSE_SCHEMA, strict: true },
+};
+
+/** Upper bound for generateScenarios(difficulty, count). */
+export const MAX_SCENARIO_BATCH = 8;
+
+// Compiled once at module load; reused for every generated payload.
+const validateScenarioResponse = compileSchema(SCENARIO_RESPONSE_SCHEMA);
+
+/**
+ * Several scenarios in one call, exactly `count` of them; strict mode requires an
+ * object at the root. Built and compiled for every batch size at module load.
+ */
+const SCENARIO_BATCH_RESPONSES = Object.fromEntries(
+  Array.from({ length: MAX_SCENARIO_BATCH - 1 }, (_, i) => {
+    const count = i + 2;
+    const schema = strictObject({
+      scenarios: { type: 'array', items: SCENARIO_RESPONSE_SCHEMA, minItems: count, maxItems: count },
+    });
+    return [count, {
+      format: {
+        type: 'json_schema',
+        json_schema: { name: 'scenario_batch', schema, strict: true },
+      },
+      validate: compileSchema(schema),
+    }];
+  })
+);
+
 // -----------------------------------------------------------------------------
 // Generator and system prompt builder
 // -----------------------------------------------------------------------------
 
 const VALID_DIFFICULTIES = ['easy', 'medium', 'hard'];
 
+const SCENARIO_MODEL = 'gpt-4o-mini';
+const SCENARIO_TEMPERATURE = 0.8;
+/** Routes scenario requests (which share one prompt prefix) to the same prompt-cache shard. */
+const SCENARIO_PROMPT_CACHE_KEY = 'scenario-generator';
+
+let openai = null;
+let openaiKey = null;
+
+/** The openai SDK is imported on first use, so importing this module stays cheap. */
+let openaiModule = null;
+
+/**
+ * Shared OpenAI client so the underlying keep-alive connection pool is reused
+ * across scenario requests instead of being rebuilt per call.
+ * @returns {Promise<import('openai').default>}
+ * @throws {Error} If OPENAI_API_KEY is not set.
+ */
+async function getOpenAI() {
+  const apiKey = config.openai?.apiKey || process.env.OPENAI_API_KEY;
+  if (!apiKey) {
+    throw new Error('OPENAI_API_KEY environment variable is not set');
+  }
+  if (!openai || openaiKey !== apiKey) {
+    openaiModule ??= import('openai').catch((err) => {
+      openaiModule = null; // let the next call retry instead of caching the failure
+      throw err;
+    });
+    const { default: OpenAI } = await openaiModule;
+    openai = new OpenAI({ apiKey });
+    openaiKey = apiKey;
+  }
+  return openai;
+}
+
 function isDemoMode() {
   const v = process.env.DEMO;
   return v === 'true';
@@ -131,6 +285,124 @@ function getDemoScenarioPayload(difficulty) {
   return JSON.parse(process.env.DEMO_SCENARIO_PAYLOAD);
 }
 
+/**
+ * Accumulate a streamed chat completion that should contain one JSON object.
+ * Aborts the stream as soon as the output cannot be a JSON object (first
+ * non-whitespace character is not "{"), and rejects truncated output
+ * (finish_reason "length") instead of failing later in JSON.parse.
+ *
+ * @param {AsyncIterable<object>} stream - Result of chat.completions.create({ stream: true }).
+ * @returns {Promise<string>} Full message content.
+ */
+async function collectJsonObjectStream(stream) {
+  const pieces = [];
+  let started = false;
+  let finishReason = null;
+  for await (const chunk of stream) {
+    const choice = chunk.choices[0];
+    if (!choice) continue;
+    if (choice.delta?.refusal) {
+      throw new Error('OpenAI refused to generate the scenario');
+    }
+    const delta = choice.delta?.content;
+    if (delta) {
+      if (!started) {
+        const first = delta.trimStart();
+        if (first) {
+          if (first[0] !== '{') {
+            // Leaving the loop aborts the underlying HTTP request.
+            throw new Error('OpenAI returned a non-JSON response');
+          }
+          started = true;
+        }
+      }
+      pieces.push(delta);
+    }
+    if (choice.finish_reason) finishReason = choice.finish_reason;
+  }
+
+  if (!started) {
+    throw new Error('OpenAI returned empty response');
+  }
+  if (finishReason === 'length') {
+    throw new Error('OpenAI response was truncated (max tokens reached)');
+  }
+  return pieces.join('');
+}
+
+function normalizeDifficulty(difficulty) {
+  const normalized = difficulty?.trim?.().toLowerCase();
+  if (!VALID_DIFFICULTIES.includes(normalized)) {
+    throw new Error('difficulty must be one of: easy, medium, hard');
+  }
+  return normalized;
+}
+
+/**
+ * Run one streamed structured-output completion and parse it.
+ * @param {object[]} messages - Chat messages.
+ * @param {object} responseFormat - response_format for the request.
+ * @param {(value: unknown) => string[]} validate - Compiled schema validator.
+ * @returns {Promise<object>} Parsed, schema-valid JSON.
+ */
+async function requestScenarioJson(messages, responseFormat, validate) {
+  const client = await getOpenAI();
+  const stream = await client.chat.completions.create({
+    model: SCENARIO_MODEL,
+    temperature: SCENARIO_TEMPERATURE,
+    prompt_cache_key: SCENARIO_PROMPT_CACHE_KEY,
+    response_format: responseFormat,
+    messages,
+    stream: true,
+  });
+
+  const content = await collectJsonObjectStream(stream);
+  return parseScenarioJson(content, validate);
+}
+
+function parseScenarioJson(content, validate) {
+  const parsed = JSON.parse(content);
+  const errors = validate(parsed);
+  if (errors.length) {
+    throw new Error(`OpenAI returned an invalid scenario: ${errors.slice(0, 5).join('; ')}`);
+  }
+  return parsed;
+}
+
+/**
+ * Non-streaming chat completion request for one scenario (random scenario type), for
+ * callers that submit requests themselves, e.g. the Batch API prewarmer script.
+ * @param {string} difficulty - One of "easy", "medium", "hard".
+ * @returns {{ scenarioType: string, body: object }} The picked type and the body for
+ *   POST /v1/chat/completions.
+ */
+export function buildScenarioRequest(difficulty) {
+  const normalized = normalizeDifficulty(difficulty);
+  const scenarioType = pickRandomScenarioType(normalized);
+  return {
+    scenarioType,
+    body: {
+      model: SCENARIO_MODEL,
+      temperature: SCENARIO_TEMPERATURE,
+      prompt_cache_key: SCENARIO_PROMPT_CACHE_KEY,
+      response_format: SCENARIO_RESPONSE_FORMAT,
+      messages: getMessages(normalized, scenarioType),
+    },
+  };
+}
+
+/**
+ * Turn the message content of a completion made with buildScenarioRequest() into a
+ * full payload (validated, fallbacks filled, voice fields derived).
+ * @param {string} content - Model output (one JSON object).
+ * @param {{ difficulty: string, scenarioType: string }} requested - What the request asked for.
+ * @returns {object} Same shape as generateScenario().
+ * @throws {Error} If the content is not valid JSON or does not match the schema.
+ */
+export function parseScenarioContent(content, requested) {
+  return finalizeScenarioPayload(parseScenarioJson(content, validateScenarioResponse), requested);
+}
+
 /**
  * Generate a single scenario payload for the given difficulty.
  * The LLM returns only scenario + timeline; persona and other voice-agent fields
@@ -143,45 +415,84 @@ function getDemoScenarioPayload(difficulty) {
  * @throws {Error} If OPENAI_API_KEY is missing (when not DEMO), difficulty is invalid, or OpenAI API errors.
  */
 export async function generateScenario(difficulty) {
-  const normalized = difficulty?.trim?.().toLowerCase();
-  if (!VALID_DIFFICULTIES.includes(normalized)) {
-    throw new Error('difficulty must be one of: easy, medium, hard');
-  }
+  const normalized = normalizeDifficulty(difficulty);
 
   let payload = {};
+  let requested = {};
   if (process.env.DEMO !== 'true') {
-    const apiKey = config.openai?.apiKey || process.env.OPENAI_API_KEY;
-    if (!apiKey) {
-      throw new Error('OPENAI_API_KEY environment variable is not set');
-    }
-
-    const client = new OpenAI({ apiKey });
     const scenarioType = pickRandomScenarioType(normalized);
-
-    const response = await client.chat.completions.create({
-      model: 'gpt-4o-mini',
-      temperature: 0.8,
-      response_format: { type: 'json_object' },
-      messages: [
-        { role: 'system', content: SYSTEM_PROMPT },
-        { role: 'user', content: userPrompt(normalized, scenarioType) },
-      ],
-    });
-
-    const content = response.choices[0]?.message?.content;
-    if (!content) {
-      throw new Error('OpenAI returned empty response');
-    }
-
-    payload = JSON.parse(content);
+    payload = await requestScenarioJson(
+      getMessages(normalized, scenarioType),
+      SCENARIO_RESPONSE_FORMAT,
+      validateScenarioResponse
+    );
+    requested = { difficulty: normalized, scenarioType };
   }
   else {
      payload = JSON.parse(process.env.DEMO_SCENARIO_PAYLOAD);
   }
+  return finalizeScenarioPayload(payload, requested);
+}
+
+/**
+ * Generate several scenario payloads for one difficulty in a single LLM call, so the
+ * fixed per-request overhead (connection, queueing, time to first token) is paid once.
+ * Each scenario gets a different scenario type while the pool lasts.
+ *
+ * @param {string} difficulty - One of "easy", "medium", "hard".
+ * @param {number} count - Number of scenarios, 1 to MAX_SCENARIO_BATCH.
+ * @returns {Promise<object[]>} `count` payloads, each shaped like generateScenario()'s.
+ * @throws {Error} If difficulty or count is invalid, the model returns the wrong number of
+ *   scenarios, or OpenAI API errors.
+ */
+export async function generateScenarios(difficulty, count) {
+  const normalized = normalizeDifficulty(difficulty);
+  if (!Number.isInteger(count) || count < 1 || count > MAX_SCENARIO_BATCH) {
+    throw new Error(`count must be an integer from 1 to ${MAX_SCENARIO_BATCH}`);
+  }
+  if (count === 1) return [await generateScenario(normalized)];
+
+  if (process.env.DEMO === 'true') {
+    return Array.from({ length: count }, () =>
+      finalizeScenarioPayload(JSON.parse(process.env.DEMO_SCENARIO_PAYLOAD))
+    );
+  }
+
+  const scenarioTypes = pickRandomScenarioTypes(normalized, count);
+  const { format, validate } = SCENARIO_BATCH_RESPONSES[count];
+  const { scenarios } = await requestScenarioJson(
+    [
+      { role: 'system', content: SYSTEM_PROMPT },
+      { role: 'user', content: batchUserPrompt(normalized, scenarioTypes) },
+    ],
+    format,
+    validate
+  );
+  return scenarios.map((payload, i) =>
+    finalizeScenarioPayload(payload, { difficulty: normalized, scenarioType: scenarioTypes[i] })
+  );
+}
+
+/**
+ * Fill in fallbacks (id, language, SF location, timeline map) and derive the
+ * voice-agent fields on a raw LLM or DEMO payload.
+ * @param {object} payload - Raw payload (mutated).
+ * @param {{ difficulty?: string, scenarioType?: string }} [requested] - What the LLM was
+ *   asked for; overrides the model's labels so payloads are filed under the right difficulty,
+ *   and replaces the model's id. Omitted for the DEMO payload.
+ * @returns {object} The same payload.
+ */
+function finalizeScenarioPayload(payload, requested = {}) {
   const scenario = payload.scenario || {};
 
-  if (!scenario.id) {
-    scenario.id = `scenario-${randomUUID().slice(0, 8)}`;
+  if (requested.difficulty) scenario.difficulty = requested.difficulty;
+  if (requested.scenarioType) scenario.scenario_type = requested.scenarioType;
+
+  // The frontend keys session records and review/simulation links by scenario.id, and
+  // model-chosen ids repeat across calls and within a batch (e.g. "scenario-001"), so
+  // LLM payloads (those with `requested` labels) always get a server-assigned id.
+  if (!scenario.id || requested.difficulty) {
+    scenario.id = `scenario-${randomBytes(4).toString('hex')}`;
   }
   if (scenario.language !== 'en') {
     scenario.language = 'en';
@@ -204,6 +515,18 @@ export async function generateScenario(difficulty) {
 
   payload.scenario = scenario;
 
+  // Structured output returns the timeline as [{ seconds, event }]; consumers expect a map.
+  // Events at the same second are joined rather than overwritten.
+  if (Array.isArray(payload.timeline)) {
+    const timeline = {};
+    for (const item of payload.timeline) {
+      if (!item || !Number.isFinite(item.seconds) || !item.event) continue;
+      const key = String(item.seconds);
+      timeline[key] = timeline[key] ? `${timeline[key]}; ${item.event}` : item.event;
+    }
+    payload.timeline = timeline;
+  }
+
   // Ensure timeline exists: map of seconds (as string keys) -> event description
   if (payload.timeline == null || typeof payload.timeline !== 'object' || Array.isArray(payload.timeline)) {
     payload.timeline = {};
@@ -255,6 +578,18 @@ function deriveVoiceFields(payload) {
   payload.do_not_say = payload.do_not_say ?? [];
 }
 
+/**
+ * "## header" followed by one "- item" line per entry, or null when items is not a
+ * non-empty array (so callers can skip the section).
+ */
+function bulletSection(header, items) {
+  return Array.isArray(items) && items.length ? `${header}\n- ${items.join('\n- ')}` : null;
+}
+
+const PROFILE_KEYS = ['name', 'age', 'emotion', 'gender', 'race', 'other_relevant_details'];
+
+const PROBING_NOTE = "These are NOT things you are purposely hiding. They are contextual details that help the operator understand the situation better; they simply don't come up until the operator asks the right questions (e.g. suspect description, layout, who else is present). When the operator probes or asks relevant questions, provide these details naturally.";
+
 /**
  * Build a single system prompt string for the ElevenLabs Flash v2.5 voice agent
  * from the scenario generator payload.
@@ -274,10 +609,11 @@ export function buildVoiceAgentSystemPrompt(payload) {
 
   const scenario = payload.scenario || {};
   const callerProfile = scenario.caller_profile || {};
-  const profileKeys = ['name', 'age', 'emotion', 'gender', 'race', 'other_relevant_details'];
-  const profileParts = profileKeys
-    .filter((key) => callerProfile[key] != null && callerProfile[key] !== '')
-    .map((key) => `- ${key}: ${callerProfile[key]}`);
+  const profileParts = [];
+  for (const key of PROFILE_KEYS) {
+    const value = callerProfile[key];
+    if (value != null && value !== '') profileParts.push(`- ${key}: ${value}`);
+  }
   if (profileParts.length) {
     parts.push(`## Caller personal details\n${profileParts.join('\n')}`);
   }
@@ -285,16 +621,14 @@ export function buildVoiceAgentSystemPrompt(payload) {
   const summary = payload.scenario_summary_for_agent || '';
   if (summary) parts.push(`## Scenario summary (ground truth)\n${summary}`);
 
-  const critical = payload.scenario?.critical_info ?? payload.critical_info;
-  if (Array.isArray(critical) && critical.length) {
-    parts.push(`## Critical information to convey (reveal when the operator asks; do not dump all at once)\n${critical.map((item) => `- ${item}`).join('\n')}`);
-  }
+  const critical = bulletSection(
+    '## Critical information to convey (reveal when the operator asks; do not dump all at once)',
+    payload.scenario?.critical_info ?? payload.critical_info
+  );
+  if (critical) parts.push(critical);
 
-  const withheld = payload.withheld_information;
-  if (Array.isArray(withheld) && withheld.length) {
-    const lines = withheld.map((item) => `- ${item}`).join('\n');
-    parts.push(`## Details that emerge with operator probing\n${lines}\nThese are NOT things you are purposely hiding. They are contextual details that help the operator understand the situation better; they simply don't come up until the operator asks the right questions (e.g. suspect description, layout, who else is present). When the operator probes or asks relevant questions, provide these details naturally.`);
-  }
+  const withheld = bulletSection('## Details that emerge with operator probing', payload.withheld_information);
+  if (withheld) parts.push(`${withheld}\n${PROBING_NOTE}`);
 
   const persona = payload.persona || {};
   const voiceDesc = persona.voice_description || '';
@@ -303,18 +637,14 @@ export function buildVoiceAgentSystemPrompt(payload) {
   const dialogueDir = payload.dialogue_directions || '';
   if (dialogueDir) parts.push(`## Dialogue / acting directions\n${dialogueDir}`);
 
-  const responseBeh = payload.response_behavior;
-  if (Array.isArray(responseBeh) && responseBeh.length) {
-    parts.push(`## How to react to the operator\n${responseBeh.map((item) => `- ${item}`).join('\n')}`);
-  }
+  const responseBeh = bulletSection('## How to react to the operator', payload.response_behavior);
+  if (responseBeh) parts.push(responseBeh);
 
   const opening = payload.opening_line || '';
   if (opening) parts.push(`## Opening line\nWhen the call connects, start with something like: "${opening}"`);
 
-  const doNot = payload.do_not_say;
-  if (Array.isArray(doNot) && doNot.length) {
-    parts.push(`## Do NOT say (stay in character)\n${doNot.map((item) => `- ${item}`).join('\n')}`);
-  }
+  const doNot = bulletSection('## Do NOT say (stay in character)', payload.do_not_say);
+  if (doNot) parts.push(doNot);
 
   const behavior = payload.behavior_notes || '';
   if (behavior) parts.push(`## Behavioral notes\n${behavior}`);
@@ -0,0 +1,145 @@
+/**
+ * Minimal JSON Schema validator for LLM output.
+ * - compileSchema: walk a schema once and return a reusable validate(instance) function
+ *
+ * Supports the subset used by our response schemas: type (string or array of types),
+ * enum, required, properties, additionalProperties (false), items, minItems and maxItems;
+ * description and title are accepted as annotations. Any other keyword is rejected at
+ * compile time.
+ */
+
+const TYPE_CHECKS = {
+  object: (v) => v != null && typeof v === 'object' && !Array.isArray(v),
+  array: (v) => Array.isArray(v),
+  string: (v) => typeof v === 'string',
+  number: (v) => typeof v === 'number' && Number.isFinite(v),
+  integer: (v) => Number.isInteger(v),
+  boolean: (v) => typeof v === 'boolean',
+  null: (v) => v === null,
+};
+
+const SUPPORTED_KEYWORDS = new Set([
+  'type',
+  'enum',
+  'required',
+  'properties',
+  'additionalProperties',
+  'items',
+  'minItems',
+  'maxItems',
+  'description',
+  'title',
+]);
+
+/**
+ * Compile a schema into a validator. Unsupported keywords and unknown types throw here
+ * (at compile time), so a bad schema fails on module load rather than being silently
+ * ignored on every request.
+ * @param {object} schema - JSON Schema (subset, see module doc).
+ * @returns {(instance: unknown) => string[]} Validator returning error messages ("$" = root); empty when valid.
+ */
+export function compileSchema(schema) {
+  const check = compileNode(schema, '$');
+  return (instance) => {
+    const errors = [];
+    check(instance, '$', errors);
+    return errors;
+  };
+}
+
+function compileNode(schema, schemaPath) {
+  for (const keyword of Object.keys(schema)) {
+    if (!SUPPORTED_KEYWORDS.has(keyword)) {
+      throw new Error(`Unsupported schema keyword "${keyword}" at ${schemaPath}`);
+    }
+  }
+  if (schema.additionalProperties != null && typeof schema.additionalProperties !== 'boolean') {
+    throw new Error(`Only boolean additionalProperties is supported at ${schemaPath}`);
+  }
+
+  const checks = [];
+
+  if (schema.type != null) {
+    const types = Array.isArray(schema.type) ? schema.type : [schema.type];
+    const fns = types.map((t) => {
+      const fn = TYPE_CHECKS[t];
+      if (!fn) throw new Error(`Unsupported schema type "${t}" at ${schemaPath}`);
+      return fn;
+    });
+    const label = types.join('|');
+    checks.push((v, path, errors) => {
+      if (fns.some((fn) => fn(v))) return true;
+      errors.push(`${path}: expected ${label}`);
+      return false;
+    });
+  }
+
+  if (Array.isArray(schema.enum)) {
+    const allowed = new Set(schema.enum);
+    const label = schema.enum.join(', ');
+    checks.push((v, path, errors) => {
+      if (allowed.has(v)) return true;
+      errors.push(`${path}: must be one of ${label}`);
+      return false;
+    });
+  }
+
+  if (Array.isArray(schema.required) && schema.required.length) {
+    const required = schema.required;
+    checks.push((v, path, errors) => {
+      if (!TYPE_CHECKS.object(v)) return true;
+      for (const key of required) {
+        if (!(key in v)) errors.push(`${path}.${key}: is required`);
+      }
+      return true;
+    });
+  }
+
+  if (schema.properties && typeof schema.properties === 'object') {
+    const props = Object.entries(schema.properties).map(([key, sub]) => [
+      key,
+      compileNode(sub, `${schemaPath}.${key}`),
+    ]);
+    const closed = schema.additionalProperties === false;
+    const known = new Set(Object.keys(schema.properties));
+    checks.push((v, path, errors) => {
+      if (!TYPE_CHECKS.object(v)) return true;
+      for (const [key, sub] of props) {
+        if (v[key] !== undefined) sub(v[key], `${path}.${key}`, errors);
+      }
+      if (closed) {
+        for (const key of Object.keys(v)) {
+          if (!known.has(key)) errors.push(`${path}.${key}: is not allowed`);
+        }
+      }
+      return true;
+    });
+  }
+
+  if (Number.isInteger(schema.minItems) || Number.isInteger(schema.maxItems)) {
+    const min = schema.minItems ?? 0;
+    const max = schema.maxItems ?? Infinity;
+    checks.push((v, path, errors) => {
+      if (!Array.isArray(v)) return true;
+      if (v.length < min) errors.push(`${path}: expected at least ${min} items, got ${v.length}`);
+      if (v.length > max) errors.push(`${path}: expected at most ${max} items, got ${v.length}`);
+      return true;
+    });
+  }
+
+  if (schema.items && typeof schema.items === 'object') {
+    const item = compileNode(schema.items, `${schemaPath}[]`);
+    checks.push((v, path, errors) => {
+      if (!Array.isArray(v)) return true;
+      for (let i = 0; i < v.length; i++) item(v[i], `${path}[${i}]`, errors);
+      return true;
+    });
+  }
+
+  // Stop at the first failing type/enum check so nested errors don't pile up on a wrong type.
+  return (v, path, errors) => {
+    for (const c of checks) {
+      if (!c(v, path, errors)) return;
+    }
+  };
+}